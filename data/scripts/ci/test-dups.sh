@@ -13,6 +13,6 @@ chown -R dups:dups /home/dups/source
 # SSH server is required for remote tests
 /usr/sbin/sshd
 
-# Run all unittests
+# Run all unittests, failing remote ones if sshd did not come up
 cd /home/dups/source
-su dups -c "${PYTHON} -m pytest -vv tests"
+su dups -c "DUPS_TEST_REQUIRE_SSH=1 ${PYTHON} -m pytest -vv tests"
@@ -107,7 +107,9 @@ class Backup(object):
             except ValueError:
                 continue
 
-            bak = cls.from_name(io, f, root_dir)
+            # No need for `Backup.from_name`, the listing already proves
+            # the backups existence.
+            bak = cls(io, root_dir, f)
 
             if include_valid and include_invalid:
                 backups.append(bak)
@@ -226,7 +228,7 @@ class Backup(object):
     @property
     def info(self):
         """dict: Data stored in the backups '.info' file."""
-        if self._io.exists(self.info_path):
+        try:
             with self._io.open(self.info_path, 'r') as f:
                 try:
                     data = f.read()
@@ -235,6 +237,8 @@ class Backup(object):
                     return json.loads(data)
                 except Exception as e:
                     LOGGER.error(e)
+        except FileNotFoundError:
+            pass
         return {}
 
     @property
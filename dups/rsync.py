@@ -18,23 +18,36 @@ class Path(object):
             path (str): Path to the local/remote file/folder.
             host (str): The hostname if it's a remote item.
         """
-        self.path = path
-        self.host = host
+        self._path = path
+        self._host = host
+
+        self._is_local = host in ('', None)
+        if self._is_local:
+            self._resolved = path
+        else:
+            self._resolved = '{host}:{dest}'.format(host=host, dest=path)
+
+    @property
+    def path(self):
+        """str: Path to the local/remote file/folder."""
+        return self._path
+
+    @property
+    def host(self):
+        """str: The hostname if it's a remote item."""
+        return self._host
 
     @property
     def is_local(self):
         """bool: Whether or not this `Path`_ refers to a local file."""
-        return self.host in ('', None)
+        return self._is_local
 
     @property
     def resolved(self):
         """str: If local, the path originally provided.
            If remote, <host>:<path>
         """
-        if self.is_local:
-            return self.path
-
-        return '{host}:{dest}'.format(host=self.host, dest=self.path)
+        return self._resolved
 
 
 class Status(object):
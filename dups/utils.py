@@ -479,13 +479,17 @@ class IO:
         if self.is_local:
             return os.makedirs(path, exist_ok=True)
 
-        current = '/'
-        # TODO: maybe use os.path.split
-        for p in path.split('/'):
-            current = os.path.join(current, p)
-            if self.exists(current):
-                continue
-            self._sftp.mkdir(current)
+        # Every check is a sftp round-trip. Walk up from `path` until an
+        # existing directory is found instead of checking every component
+        # from the root down.
+        missing = []
+        current = os.path.normpath(path)
+        while current != '/' and not self.exists(current):
+            missing.append(current)
+            current = os.path.dirname(current)
+
+        for p in reversed(missing):
+            self._sftp.mkdir(p)
 
     @validate_absolute
     def touch(self, path):
@@ -0,0 +1,58 @@
+import context  # noqa: F401, isort:skip
+import socket
+
+from dups import utils
+
+import pytest
+
+
+def pytest_configure(config):
+    # Registered here as pytest-xdist is optional
+    config.addinivalue_line(
+        'markers', 'xdist_group(name): run all tests of a group on the same '
+        'pytest-xdist worker.')
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items):
+    # Group tests by their "io" target so "--dist=loadgroup" runs local and
+    # remote tests on separate workers and never splits one target's tests.
+    # Has to run before pytest-xdist reads the markers.
+    for item in items:
+        callspec = getattr(item, 'callspec', None)
+        if callspec is None or 'io' not in callspec.params:
+            continue
+        item.add_marker(pytest.mark.xdist_group(name=callspec.params['io']))
+
+
+@pytest.fixture(scope='session')
+def have_ssh():
+    """bool: Whether or not a ssh server is listening on `SSH_HOST`."""
+    sock = socket.socket()
+    sock.settimeout(0.2)
+    try:
+        return sock.connect_ex((context.SSH_HOST, 22)) == 0
+    finally:
+        sock.close()
+
+
+@pytest.fixture(scope='module', params=['local', 'remote'])
+def io(request, have_ssh):
+    """A `utils.IO` instance shared by all tests of a module and target.
+
+    Module scoped so the test modules keep their order while remote tests
+    within a module still reuse a single ssh connection.
+    """
+    if request.param == 'local':
+        io_ = utils.IO.get()
+    else:
+        if not have_ssh:
+            msg = 'no ssh server on {}'.format(context.SSH_HOST)
+            if context.REQUIRE_SSH:
+                pytest.fail(msg)
+            pytest.skip(msg)
+        io_ = utils.IO.get(context.SSH_HOST)
+
+    yield io_
+
+    io_.close()
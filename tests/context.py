@@ -9,20 +9,47 @@ sys.path.insert(0, os.path.abspath(os.path.join(HERE, os.pardir)))
 DUPS = os.path.join(HERE, os.pardir, 'run')
 """Path to runnable dups binary"""
 
-TMP_DIR = os.path.join(HERE, 'tmp')
-"""Directory path to store temporary files for backup."""
+WORKER = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+"""Id of the pytest-xdist worker running the tests (if any).
+Used to give each worker its own temporary directories.
+"""
 
-TARGET_DIR = os.path.join('/', 'tmp', 'dups-pytest')
-"""Directory path to use as backup target.
-config-local.yaml and config-remote.yaml have this set as well.
+TMP_ROOT = os.environ.get('DUPS_TEST_TMPDIR')
+"""Directory path in which all temporary files and directories get created.
+Can be set with the "DUPS_TEST_TMPDIR" environment variable and defaults to
+"/dev/shm" (if available) to keep filesystem heavy tests in memory.
 """
 
+if not TMP_ROOT:
+    TMP_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') else '/tmp'
+
+TMP_DIR = os.path.join(TMP_ROOT, 'dups-pytest-tmp-{}'.format(WORKER))
+"""Directory path to store temporary files for backup."""
+
+TMP_FILE = os.path.join(TMP_ROOT, 'dups-pytest-tmp-{}.file'.format(WORKER))
+"""File path to use for temporary file operations."""
+
+TARGET_DIR = os.path.join(TMP_ROOT, 'dups-pytest-{}'.format(WORKER))
+"""Directory path to use as backup target."""
+
 DATA_DIR = os.path.join(HERE, 'data')
 """Directory path holding some test data."""
 
+TEST_FILE = os.path.join(DATA_DIR, 'test.file')
+"""Path to a test file within `DATA_DIR`."""
+
+TEST_DIR = os.path.join(DATA_DIR, 'test.dir')
+"""Path to a test directory within `DATA_DIR`."""
+
 SSH_HOST = 'localhost'
 """SSH Host to use for unittests."""
 
+REQUIRE_SSH = os.environ.get('DUPS_TEST_REQUIRE_SSH', '') not in ('', '0')
+"""Whether or not remote tests fail instead of being skipped if no ssh server
+is listening on `SSH_HOST`.
+Can be enabled with the "DUPS_TEST_REQUIRE_SSH" environment variable.
+"""
+
 SSH_CONFIG = os.path.expanduser('~/.ssh/config')
 """Path to ssh config file."""
 
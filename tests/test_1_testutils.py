@@ -1,6 +1,6 @@
 import context  # noqa: F401, isort:skip
 import os
-import shutil
+from contextlib import suppress
 
 import testutils
 
@@ -17,8 +17,8 @@ STRUCT = {
 
 
 def teardown_function(func):
-    if os.path.exists(context.TMP_DIR):
-        shutil.rmtree(context.TMP_DIR)
+    with suppress(FileNotFoundError):
+        testutils.remove_dir_struct(context.TMP_DIR)
 
 
 def test_create_dir_struct():
@@ -27,13 +27,22 @@ def test_create_dir_struct():
     assert not os.path.isfile(
         os.path.join(context.TMP_DIR, '***dir2***', '😀').encode())
 
-    testutils.create_dir_struct(STRUCT, context.TMP_DIR)
+    created = testutils.create_dir_struct(STRUCT, context.TMP_DIR)
 
     assert os.path.isfile(
         os.path.join(context.TMP_DIR, 'dir1', 'sub1', 'file1'))
     assert os.path.isfile(
         os.path.join(context.TMP_DIR, '***dir2***', '😀').encode())
 
+    tmp = os.path.abspath(context.TMP_DIR).encode()
+    assert created == {
+        os.path.join(tmp, b'dir1'),
+        os.path.join(tmp, b'dir1', b'sub1'),
+        os.path.join(tmp, b'dir1', b'sub1', b'file1'),
+        os.path.join(tmp, b'***dir2***'),
+        os.path.join(tmp, b'***dir2***', '😀'.encode()),
+    }
+
 
 def test_get_dir_struct():
     testutils.create_dir_struct(STRUCT, context.TMP_DIR)
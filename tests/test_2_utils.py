@@ -1,24 +1,27 @@
 import context  # noqa: F401, isort:skip
 
 import os
-import shutil
-from datetime import datetime, timedelta
+from contextlib import suppress
+from datetime import datetime
 
 from dups import utils
 
 import pytest
+import testutils
 
 
-class Test_gffs:
-    def test_rotate_gffs_weekday_6(self):
-        start = datetime(2017, 12, 31)
+@pytest.fixture(scope='module')
+def seven_years_of_dates():
+    start = datetime(2017, 12, 31)
+    return [
+        datetime.fromordinal(start.toordinal() - i) for i in range(365 * 7)
+    ]
 
-        datetimes = []
-        for i in range(365 * 6):
-            datetimes.append(start - timedelta(days=i))
 
-        gffs = utils.rotate_gffs(datetimes, days=7, weeks=4, months=12,
-                                 years=3, weekday_full=6)
+class Test_gffs:
+    def test_rotate_gffs_weekday_6(self, seven_years_of_dates):
+        gffs = utils.rotate_gffs(seven_years_of_dates[:365 * 6], days=7,
+                                 weeks=4, months=12, years=3, weekday_full=6)
 
         assert gffs[4] == [
             # Years
@@ -53,15 +56,9 @@ class Test_gffs:
             datetime(2017, 12, 31),
         ]
 
-    def test_rotate_gffs_weekday_0(self):
-        start = datetime(2017, 12, 31)
-
-        datetimes = []
-        for i in range(365 * 7):
-            datetimes.append(start - timedelta(days=i))
-
-        gffs = utils.rotate_gffs(datetimes, days=7, weeks=4, months=12,
-                                 years=3, weekday_full=0)
+    def test_rotate_gffs_weekday_0(self, seven_years_of_dates):
+        gffs = utils.rotate_gffs(seven_years_of_dates[:365 * 7], days=7,
+                                 weeks=4, months=12, years=3, weekday_full=0)
 
         assert gffs[4] == [
             # Years
@@ -98,34 +95,12 @@ class Test_gffs:
 
 
 class Test_IO:
-    TMP_FILE = os.path.join(context.HERE, 'tmp.file')
-    TEST_FILE = os.path.join(context.DATA_DIR, 'test.file')
-    TEST_DIR = os.path.join(context.DATA_DIR, 'test.dir')
-
     def teardown_method(self, method):
-        if os.path.exists(context.TMP_DIR):
-            shutil.rmtree(context.TMP_DIR)
-
-        if os.path.exists(Test_IO.TMP_FILE):
-            os.remove(Test_IO.TMP_FILE)
-
-    def get_io(self, target):
-        if target == 'local':
-            return utils.IO.get()
-        elif target == 'remote':
-            return utils.IO.get(context.SSH_HOST)
-        return None
-
-    @pytest.mark.parametrize('target', ['local', 'remote'])
-    def test_is_local(self, target):
-        io = self.get_io(target)
+        with suppress(FileNotFoundError):
+            testutils.remove_dir_struct(context.TMP_DIR)
 
-        if target == 'local':
-            assert io.is_local
-        elif target == 'remote':
-            assert not io.is_local
-
-        io.close()
+        with suppress(FileNotFoundError):
+            os.remove(context.TMP_FILE)
 
     def test_validate_absolute(self):
         @utils.validate_absolute
@@ -135,97 +110,53 @@ class Test_IO:
         with pytest.raises(ValueError):
             test('.')
 
-    @pytest.mark.parametrize('target', ['local', 'remote'])
-    def test_isfile(self, target):
-        io = self.get_io(target)
-
-        assert not io.isfile(Test_IO.TEST_DIR)
-        assert io.isfile(Test_IO.TEST_FILE)
-
-        io.close()
-
-    @pytest.mark.parametrize('target', ['local', 'remote'])
-    def test_isdir(self, target):
-        io = self.get_io(target)
+    def test_is_local(self, request, io):
+        target = request.node.callspec.params['io']
+        assert io.is_local is (target == 'local')
 
-        assert io.isdir(Test_IO.TEST_DIR)
-        assert not io.isdir(Test_IO.TEST_FILE)
+    def test_isfile(self, io):
+        assert not io.isfile(context.TEST_DIR)
+        assert io.isfile(context.TEST_FILE)
 
-        io.close()
-
-    @pytest.mark.parametrize('target', ['local', 'remote'])
-    def test_listdir(self, target):
-        io = self.get_io(target)
+    def test_isdir(self, io):
+        assert io.isdir(context.TEST_DIR)
+        assert not io.isdir(context.TEST_FILE)
 
+    def test_listdir(self, io):
         files = ['dir1', 'dir2', 'file1', 'file2']
-        assert len(files) == len(io.listdir(Test_IO.TEST_DIR))
-
-        io.close()
-
-    @pytest.mark.parametrize('target', ['local', 'remote'])
-    def test_mkdir(self, target):
-        io = self.get_io(target)
+        assert len(files) == len(io.listdir(context.TEST_DIR))
 
+    def test_mkdir(self, io):
         io.mkdir(context.TMP_DIR)
         assert os.path.isdir(context.TMP_DIR)
 
-        io.close()
-
-    @pytest.mark.parametrize('target', ['local', 'remote'])
-    def test_makedirs(self, target):
-        io = self.get_io(target)
-
+    def test_makedirs(self, io):
         nested = os.path.join(context.TMP_DIR, 'nested', 'dir')
 
         io.makedirs(nested)
         assert os.path.isdir(nested)
 
-        io.close()
-
-    @pytest.mark.parametrize('target', ['local', 'remote'])
-    def test_touch(self, target):
-        io = self.get_io(target)
-
-        io.touch(Test_IO.TMP_FILE)
-        assert os.path.isfile(Test_IO.TMP_FILE)
-
-        io.close()
-
-    @pytest.mark.parametrize('target', ['local', 'remote'])
-    def test_exists(self, target):
-        io = self.get_io(target)
-
-        assert io.exists(Test_IO.TEST_FILE)
-        assert not io.exists(Test_IO.TMP_FILE)
+    def test_touch(self, io):
+        io.touch(context.TMP_FILE)
+        assert os.path.isfile(context.TMP_FILE)
 
-        io.close()
+    def test_exists(self, io):
+        assert io.exists(context.TEST_FILE)
+        assert not io.exists(context.TMP_FILE)
 
-    @pytest.mark.parametrize('target', ['local', 'remote'])
-    def test_remove(self, target):
-        io = self.get_io(target)
-
-        open(Test_IO.TMP_FILE, 'a').close()
-        assert os.path.exists(Test_IO.TMP_FILE)
-        io.remove(Test_IO.TMP_FILE)
-        assert not os.path.exists(Test_IO.TMP_FILE)
-
-        io.close()
-
-    @pytest.mark.parametrize('target', ['local', 'remote'])
-    def test_rmdir(self, target):
-        io = self.get_io(target)
+    def test_remove(self, io):
+        open(context.TMP_FILE, 'a').close()
+        assert os.path.exists(context.TMP_FILE)
+        io.remove(context.TMP_FILE)
+        assert not os.path.exists(context.TMP_FILE)
 
+    def test_rmdir(self, io):
         os.makedirs(context.TMP_DIR)
         assert os.path.exists(context.TMP_DIR)
         io.rmdir(context.TMP_DIR)
         assert not os.path.exists(context.TMP_DIR)
 
-        io.close()
-
-    @pytest.mark.parametrize('target', ['local', 'remote'])
-    def test_rrmdir(self, target):
-        io = self.get_io(target)
-
+    def test_rrmdir(self, io):
         nested = os.path.join(context.TMP_DIR, 'nested', 'dir')
         os.makedirs(nested)
 
@@ -233,15 +164,10 @@ class Test_IO:
         io.rrmdir(context.TMP_DIR)
         assert not os.path.exists(context.TMP_DIR)
 
-        io.close()
-
-    @pytest.mark.parametrize('target', ['local', 'remote'])
-    def test_open(self, target):
-        io = self.get_io(target)
-
+    def test_open(self, io):
         msg = 'Hello dups!'
-        with io.open(Test_IO.TMP_FILE, 'w') as f:
+        with io.open(context.TMP_FILE, 'w') as f:
             f.write(msg)
 
-        with open(Test_IO.TMP_FILE) as f:
+        with open(context.TMP_FILE) as f:
             assert msg == f.read()
@@ -1,123 +1,117 @@
 import context  # noqa: F401, isort:skip
 
-import os
 import shlex
-import shutil
-from unittest.mock import patch
 
 from dups import rsync
 
 import pytest
 import testutils
 
+_OUT_FORMAT = "%t %i %f %''b"
 
-class Test_Path:
-    def test_local(self):
-        p = rsync.Path('/tmp')
-        assert p.is_local
-
-    def test_remote(self):
-        p = rsync.Path('/tmp', 'localhost')
-        assert not p.is_local
-
-    def test_resolved_local(self):
-        p = rsync.Path('/tmp')
-        assert p.resolved == '/tmp'
 
-    def test_resolved_remote(self):
-        p = rsync.Path('/tmp', 'localhost')
-        assert p.resolved == 'localhost:/tmp'
+class Test_Path:
+    @pytest.mark.parametrize('host, is_local, resolved', [
+        (None, True, '/tmp'),
+        ('localhost', False, 'localhost:/tmp'),
+    ])
+    def test_path(self, host, is_local, resolved):
+        p = rsync.Path('/tmp', host)
+        assert p.is_local is is_local
+        assert p.resolved == resolved
 
 
 class Test_Status:
-    def test_valid(self):
-        status = rsync.Status(0)
-        assert status.exit_code == 0
+    @pytest.mark.parametrize('exit_code, is_complete', [
+        (0, True),
+        (20, False),
+    ])
+    def test_is_complete(self, exit_code, is_complete):
+        status = rsync.Status(exit_code)
+        assert status.exit_code == exit_code
+        assert status.is_complete is is_complete
 
     def test_invalid(self):
         with pytest.raises(ValueError):
             rsync.Status(-999)
 
-    def test_complete(self):
-        status = rsync.Status(0)
-        assert status.is_complete
 
-    def test_incomplete(self):
-        status = rsync.Status(20)
-        assert not status.is_complete
+def _tokenize(cmd):
+    """Split a rsync command into its shell words.
 
+    Returns:
+        tuple: 2-tuple (frozenset of all words,
+            frozenset of all pairs of adjacent words)
+    """
+    words = shlex.split(cmd.decode())
+    return frozenset(words), frozenset(zip(words, words[1:]))
 
-class Test_rsync:
-    __start_dir = os.getcwd()
 
-    def setup_method(self, method):
-        os.makedirs(context.TARGET_DIR)
-        os.chdir(context.TARGET_DIR)
+@pytest.fixture
+def exec_commands(monkeypatch):
+    """list: Commands passed to `rsync.rsync._exec` instead of running them."""
+    commands = []
 
-    def teardown_method(self, method):
-        os.chdir(self.__start_dir)
-        if os.path.isdir(context.TARGET_DIR):
-            shutil.rmtree(context.TARGET_DIR)
+    def _exec(self, command):
+        commands.append(command)
+        return iter(())
 
-    @patch('dups.rsync.rsync._exec')
-    def test_options_original(self, mock_exec):
+    monkeypatch.setattr(rsync.rsync, '_exec', _exec)
+    return commands
+
+
+class Test_rsync:
+    def test_options_original(self, exec_commands):
         sync = rsync.rsync()
         sync.sync(rsync.Path('/'), [])
 
-        cmd = mock_exec.call_args[0][0]
-        assert b'--acls' in cmd
-        assert b'--xattrs' in cmd
-        assert b'--prune-empty-dirs' in cmd
-        assert b"--out-format '%t %i %n'" in cmd
-        assert b'--dry-run' in cmd
+        words, pairs = _tokenize(exec_commands[-1])
+        assert '--acls' in words
+        assert '--xattrs' in words
+        assert '--prune-empty-dirs' in words
+        assert ('--out-format', '%t %i %n') in pairs
+        assert '--dry-run' in words
 
-    @patch('dups.rsync.rsync._exec')
-    def test_options_modified(self, mock_exec):
+    def test_options_modified(self, exec_commands):
         sync = rsync.rsync()
 
         sync.acls = False
         sync.xattrs = False
         sync.prune_empty_dirs = False
-        sync.out_format = "%t %i %f %''b"
+        sync.out_format = _OUT_FORMAT
         sync.dry_run = False
 
         sync.sync(rsync.Path('/'), [])
 
-        cmd = mock_exec.call_args[0][0]
-        assert b'--acls' not in cmd
-        assert b'--xattrs' not in cmd
-        assert b'--prune-empty-dirs' not in cmd
-        assert '--out-format {}'.format(
-            shlex.quote("%t %i %f %''b")).encode() in cmd
-        assert b'--dry-run' not in cmd
+        words, pairs = _tokenize(exec_commands[-1])
+        assert '--acls' not in words
+        assert '--xattrs' not in words
+        assert '--prune-empty-dirs' not in words
+        assert ('--out-format', _OUT_FORMAT) in pairs
+        assert '--dry-run' not in words
 
-    @patch('dups.rsync.rsync._exec')
-    def test_target_local(self, mock_exec):
+    def test_target_local(self, exec_commands):
         sync = rsync.rsync()
         sync.sync(rsync.Path('/backup-target'), [])
 
-        cmd = mock_exec.call_args[0][0]
+        cmd = exec_commands[-1]
         assert cmd.endswith(b'/backup-target')
 
-    @patch('dups.rsync.rsync._exec')
-    def test_target_remote(self, mock_exec):
+    def test_target_remote(self, exec_commands):
         sync = rsync.rsync()
         sync.sync(rsync.Path('/backup-target', 'localhost'), [])
 
-        cmd = mock_exec.call_args[0][0]
+        cmd = exec_commands[-1]
         assert cmd.endswith(b'localhost:/backup-target')
 
-    @patch('dups.rsync.rsync._exec')
-    def test_includes(self, mock_exec):
-        testutils.create_dir_struct({
-            'simple.file': None,
-            'simple folder': {},
-            'special * folder': {},
-            r'''!"#$%&'()*+,-.012:;<=>?@ABC[\]^_`abc{|}~''': None
-        })
+    def test_includes(self, exec_commands, monkeypatch, tmpdir):
+        testutils.create_dir_struct(testutils.TEST_DATA, tmpdir.strpath)
+
+        # Relative includes are checked for existence against the cwd
+        monkeypatch.chdir(tmpdir.strpath)
 
         sync = rsync.rsync()
-        sync.sync(rsync.Path(context.TARGET_DIR), [
+        sync.sync(rsync.Path(tmpdir.strpath), [
             'simple.file',
             'simple folder',
             'special * folder',
@@ -126,16 +120,17 @@ class Test_rsync:
             r'''!"#$%&'()*+,-.012:;<=>?@ABC[\]^_`abc{|}~''',
         ])
 
-        cmd = mock_exec.call_args[0][0]
-        assert b'simple.file' in cmd
-        assert b"'simple folder'" in cmd
-        assert b"'special * folder'" in cmd
+        cmd = exec_commands[-1]
+        words, _ = _tokenize(cmd)
+        assert 'simple.file' in words
+        assert 'simple folder' in words
+        assert 'special * folder' in words
+        # Non-existing items are left unquoted for the shell to expand
         assert b'not found * folder' in cmd
-        assert rb'test\ \*\ folder/*.pattern' in cmd
-        assert b"'!"  #$%&' "'" '()*+,-.012:;<=>?@ABC[\]^_`abc{|}~'" in cmd
+        assert 'test * folder/*.pattern' in words
+        assert r'''!"#$%&'()*+,-.012:;<=>?@ABC[\]^_`abc{|}~''' in words
 
-    @patch('dups.rsync.rsync._exec')
-    def test_excludes(self, mock_exec):
+    def test_excludes(self, exec_commands):
         sync = rsync.rsync()
         sync.sync(rsync.Path(context.TARGET_DIR), ['/'], [
             '/tmp',
@@ -143,17 +138,16 @@ class Test_rsync:
             '*.mkv',
         ])
 
-        cmd = mock_exec.call_args[0][0]
-        assert b"--exclude /tmp" in cmd
-        assert b"--exclude 'simple folder'" in cmd
-        assert b"--exclude '*.mkv'" in cmd
+        words, pairs = _tokenize(exec_commands[-1])
+        assert ('--exclude', '/tmp') in pairs
+        assert ('--exclude', 'simple folder') in pairs
+        assert ('--exclude', '*.mkv') in pairs
 
-    @patch('dups.rsync.rsync._exec')
-    def test_link_dest(self, mock_exec):
+    def test_link_dest(self, exec_commands):
         sync = rsync.rsync()
         sync.sync(rsync.Path('/'), [],
                   link_dest='/special * path/previous_backup')
 
-        cmd = mock_exec.call_args[0][0]
-        assert b'--delete' in cmd
-        assert b"--link-dest '/special * path/previous_backup'" in cmd
+        words, pairs = _tokenize(exec_commands[-1])
+        assert '--delete' in words
+        assert ('--link-dest', '/special * path/previous_backup') in pairs
@@ -1,29 +1,69 @@
 import os
 
+TEST_DATA = {
+    'simple.file': None,
+    'simple folder': {},
+    'special * folder': {},
+    r'''!"#$%&'()*+,-.012:;<=>?@ABC[\]^_`abc{|}~''': None
+}
+"""Directory structure with special characters in file and folder names."""
+
 
 def create_dir_struct(structure, target='.'):
-    for name, item in structure.items():
-        if isinstance(name, str):
-            name = name.encode()
+    root = os.fsencode(os.path.abspath(target))
+    os.makedirs(root, exist_ok=True)
+
+    created = set()
+    pending = [(root, structure)]
+    while pending:
+        parent, structure = pending.pop()
+
+        # Create entries relative to the parents fd so the kernel doesn't
+        # have to resolve the full path for every single one of them.
+        dir_fd = os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for name, item in structure.items():
+                name = os.fsencode(name)
+                path = os.path.join(parent, name)
 
-        path = os.path.join(os.path.abspath(target).encode(), name)
+                if item is None:
+                    os.close(
+                        os.open(name, os.O_CREAT | os.O_WRONLY | os.O_CLOEXEC,
+                                0o644, dir_fd=dir_fd))
+                    created.add(path)
 
-        if item is None:
-            open(path, 'a').close()
+                elif isinstance(item, dict):
+                    os.mkdir(name, dir_fd=dir_fd)
+                    created.add(path)
+                    if len(item) > 0:
+                        pending.append((path, item))
+        finally:
+            os.close(dir_fd)
 
-        elif isinstance(item, dict):
-            os.makedirs(path)
-            if len(item) > 0:
-                create_dir_struct(item, path.decode())
+    return created
 
 
 def get_dir_struct(target):
     struct = {}
-    for item in os.listdir(target):
-        path = os.path.join(target, item)
-        if os.path.isdir(path):
-            struct[item] = get_dir_struct(path)
-        else:
-            struct[item] = None
+    pending = [(target, struct)]
+    while pending:
+        path, parent = pending.pop()
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    parent[entry.name] = {}
+                    pending.append((entry.path, parent[entry.name]))
+                else:
+                    parent[entry.name] = None
 
     return struct
+
+
+def remove_dir_struct(target):
+    with os.scandir(target) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                remove_dir_struct(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(target)